@@ -1,14 +1,26 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import base64
+import io
 import json
 import os
 import re
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:  # orjson is optional; fall back to stdlib
+    _json_loads = json.loads
+    _json_dumps = json.dumps
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -17,6 +29,12 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
+_REPEAT_RE = re.compile(r"(.)\1{6,}")
+_WORDS_RE = re.compile(r"[A-Za-z']+")
+_PUNCT_RE = re.compile(r"[.!?]")
+
+_TERMINAL: frozenset[str] = frozenset({"turn_complete", "error"})
+
 
 @dataclass
 class TurnSummary:
@@ -27,57 +45,81 @@ class TurnSummary:
     mean_abs_drift_ms: float
 
 
-def _assert_event_shape(evt: dict[str, Any]) -> None:
-    assert "type" in evt, f"event missing type: {evt}"
-
-
 def _is_decent_text(text: str) -> tuple[bool, str]:
     stripped = text.strip()
     if len(stripped) < 30:
         return False, "text too short"
-    if re.search(r"(.)\1{6,}", stripped):
+    if _REPEAT_RE.search(stripped):
         return False, "text contains repeated-character artifacts"
-    words = re.findall(r"[A-Za-z']+", stripped)
-    if len(words) < 8:
+    seen: set[str] = set()
+    total = 0
+    for m in _WORDS_RE.finditer(stripped):
+        seen.add(m.group().lower())
+        total += 1
+    if total < 8:
         return False, "not enough words"
-    uniq = len({w.lower() for w in words}) / max(1, len(words))
-    if uniq < 0.35:
+    if len(seen) / total < 0.35:
         return False, "low lexical diversity"
-    if not re.search(r"[.!?]", stripped):
+    if not _PUNCT_RE.search(stripped):
         return False, "missing sentence punctuation"
     return True, "ok"
 
 
+def _b64_decoded_len(data: str) -> int:
+    """Byte length of a base64 payload without decoding it."""
+    return (len(data) * 3) // 4 - data.count("=", -2)
+
+
+@dataclass
+class _TurnAccumulator:
+    text: io.StringIO = field(default_factory=io.StringIO)
+    audio_chunks: int = 0
+    audio_bytes: int = 0
+    video_frames: int = 0
+    drift_sum: float = 0.0
+
+
+def _on_text_delta(evt: dict[str, Any], acc: _TurnAccumulator) -> None:
+    acc.text.write(evt.get("token", ""))
+
+
+def _on_audio_chunk(evt: dict[str, Any], acc: _TurnAccumulator) -> None:
+    acc.audio_bytes += _b64_decoded_len(evt["data"])
+    acc.audio_chunks += 1
+    assert evt["duration_ms"] > 0, "audio chunk duration must be > 0"
+
+
+def _on_video_frame(evt: dict[str, Any], acc: _TurnAccumulator) -> None:
+    acc.video_frames += 1
+    acc.drift_sum += abs(float(evt.get("drift_ms", 0.0)))
+
+
+# turn_complete / error carry nothing to accumulate, so they have no handler.
+_HANDLERS: dict[str, Callable[[dict[str, Any], _TurnAccumulator], None]] = {
+    "text_delta": _on_text_delta,
+    "audio_chunk": _on_audio_chunk,
+    "video_frame": _on_video_frame,
+}
+
+
 def parse_turn_events(events: list[dict[str, Any]]) -> TurnSummary:
-    text_tokens: list[str] = []
-    audio_chunks = 0
-    audio_bytes = 0
-    video_frames = 0
-    drift_values: list[float] = []
+    acc = _TurnAccumulator()
+    handlers = _HANDLERS
 
     for evt in events:
-        _assert_event_shape(evt)
-        t = evt["type"]
-        if t == "text_delta":
-            text_tokens.append(evt.get("token", ""))
-        elif t == "audio_chunk":
-            raw = base64.b64decode(evt["data"])
-            audio_bytes += len(raw)
-            audio_chunks += 1
-            assert evt["duration_ms"] > 0, "audio chunk duration must be > 0"
-        elif t == "video_frame":
-            _ = base64.b64decode(evt["data"])
-            video_frames += 1
-            drift_values.append(abs(float(evt.get("drift_ms", 0.0))))
-        elif t in {"turn_complete", "error"}:
-            continue
-
-    mean_abs_drift = sum(drift_values) / len(drift_values) if drift_values else 0.0
+        t = evt.get("type")
+        if t is None:
+            raise AssertionError(f"event missing type: {evt}")
+        handler = handlers.get(t)
+        if handler is not None:
+            handler(evt, acc)
+
+    mean_abs_drift = acc.drift_sum / acc.video_frames if acc.video_frames else 0.0
     return TurnSummary(
-        text="".join(text_tokens),
-        audio_chunks=audio_chunks,
-        audio_bytes=audio_bytes,
-        video_frames=video_frames,
+        text=acc.text.getvalue(),
+        audio_chunks=acc.audio_chunks,
+        audio_bytes=acc.audio_bytes,
+        video_frames=acc.video_frames,
         mean_abs_drift_ms=mean_abs_drift,
     )
 
@@ -115,13 +157,16 @@ def load_app(profile: str):
 
 def recv_until_turn_complete(ws, max_events: int = 1200) -> list[dict[str, Any]]:
     events: list[dict[str, Any]] = []
+    # Server sends text frames, so receive_text + a single parse is the cheapest
+    # path (receive_bytes would fail on them; receive_json re-wraps json.loads).
+    receive_text, loads, append = ws.receive_text, _json_loads, events.append
     for _ in range(max_events):
-        evt = ws.receive_json()
-        events.append(evt)
-        if evt.get("type") in {"turn_complete", "error"}:
+        evt = loads(receive_text())
+        append(evt)
+        if evt.get("type") in _TERMINAL:
             return events
     raise RuntimeError("turn did not complete within event budget")
 
 
 def send_json(ws, payload: dict[str, Any]) -> None:
-    ws.send_text(json.dumps(payload))
+    ws.send_text(_json_dumps(payload))
@@ -16,6 +16,7 @@ Usage:
 """
 import asyncio
 import base64
+import io
 import json
 import sys
 from pathlib import Path
@@ -29,6 +30,20 @@ except ImportError as e:
     print(f"Missing dep: {e}. Run: uv add httpx websockets pillow numpy")
     sys.exit(1)
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to stdlib
+    _json_loads = json.loads
+
+try:
+    import uvloop
+
+    _run = uvloop.run
+except ImportError:  # uvloop ships with uvicorn[standard]; unavailable on Windows
+    _run = asyncio.run
+
 
 async def run_turn(
     ws: websockets.WebSocketClientProtocol,
@@ -36,8 +51,9 @@ async def run_turn(
     turn_num: int,
 ) -> bool:
     """Send text and collect response. Returns True if should continue."""
-    audio_chunks: list[bytes] = []
-    video_frames: list[tuple[int, bytes]] = []
+    audio_path = Path(f"output_turn_{turn_num}.mp3")
+    audio_chunks = 0
+    video_frames: list[tuple[int, str]] = []  # (frame_index, base64 jpeg)
 
     await ws.send(json.dumps({
         "type": "user_text",
@@ -48,38 +64,56 @@ async def run_turn(
     print(f"\n[You]: {text}")
     print("[Avatar]: ", end="", flush=True)
 
-    async for raw in ws:
-        evt = json.loads(raw)
-        t = evt.get("type")
-
-        if t == "text_delta":
-            print(evt["token"], end="", flush=True)
-        elif t == "audio_chunk":
-            audio_chunks.append(base64.b64decode(evt["data"]))
-        elif t == "video_frame":
-            frame_data = base64.b64decode(evt["data"])
-            video_frames.append((evt["frame_index"], frame_data))
-        elif t == "turn_complete":
-            break
-        elif t == "error":
-            print(f"\n[Error]: {evt.get('message', evt)}")
-            return True
+    t = None
+    with audio_path.open("wb") as audio_f:
+        async for raw in ws:
+            evt = _json_loads(raw)
+            t = evt.get("type")
+
+            if t == "text_delta":
+                sys.stdout.write(evt["token"])  # flushed at the next event boundary
+            elif t == "audio_chunk":
+                audio_f.write(base64.b64decode(evt["data"]))
+                audio_chunks += 1
+                sys.stdout.flush()
+            elif t == "video_frame":
+                video_frames.append((evt["frame_index"], evt["data"]))
+                sys.stdout.flush()
+            elif t == "turn_complete":
+                sys.stdout.flush()
+                break
+            elif t == "error":
+                print(f"\n[Error]: {evt.get('message', evt)}")
+                audio_chunks = 0  # discard partial audio
+                break
+
+    if not audio_chunks:
+        audio_path.unlink(missing_ok=True)
+    if t == "error":
+        return True
 
     print("\n")
 
     # Save audio
     if audio_chunks:
-        audio_path = Path(f"output_turn_{turn_num}.mp3")
-        audio_path.write_bytes(b"".join(audio_chunks))
-        print(f"  -> Audio: {audio_path} ({len(audio_chunks)} chunks)")
+        print(f"  -> Audio: {audio_path} ({audio_chunks} chunks)")
 
     # Save video as GIF
     if video_frames:
-        frames_pil: list[Image.Image] = []
-        for idx, rgb_bytes in sorted(video_frames, key=lambda x: x[0]):
-            arr = np.frombuffer(rgb_bytes, dtype=np.uint8).reshape(256, 256, 3)
-            img = Image.fromarray(arr, "RGB")
-            frames_pil.append(img)
+        video_frames.sort(key=lambda x: x[0])
+        # Frames are base64 JPEG; decode each into one contiguous (N, H, W, 3) RGB buffer
+        images = (
+            Image.open(io.BytesIO(base64.b64decode(jpeg_b64))).convert("RGB")
+            for _, jpeg_b64 in video_frames
+        )
+        first = next(images)
+        buf = np.empty((len(video_frames), first.height, first.width, 3), dtype=np.uint8)
+        buf[0] = np.asarray(first)
+        for i, img in enumerate(images, start=1):
+            if img.size != first.size:  # keep the buffer rectangular if the stream resizes
+                img = img.resize(first.size)
+            buf[i] = np.asarray(img)
+        frames_pil = [Image.fromarray(frame, "RGB") for frame in buf]
 
         gif_path = Path(f"output_turn_{turn_num}.gif")
         frames_pil[0].save(
@@ -100,40 +134,42 @@ async def demo(host: str = "127.0.0.1", port: int = 8000) -> None:
 
     print(f"Connecting to {base_url}...")
 
-    # Create session
-    async with httpx.AsyncClient() as client:
-        r = await client.post(f"{base_url}/v1/sessions", json={"persona_id": "casual"})
+    # Client lives for the whole demo so later session requests reuse its connection
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        r = await client.post("/v1/sessions", json={"persona_id": "casual"})
         session_id = r.json()["session_id"]
         print(f"Session: {session_id}")
 
-    print("\n" + "=" * 50)
-    print("Interactive TTH Demo")
-    print("Type your message and press Enter to send.")
-    print("Type 'quit' to exit.")
-    print("=" * 50 + "\n")
-
-    turn_num = 0
-    ws_url = f"{ws_base}/v1/sessions/{session_id}/stream"
-
-    async with websockets.connect(ws_url) as ws:
-        while True:
-            try:
-                text = input("> ").strip()
-            except (EOFError, KeyboardInterrupt):
-                print("\nExiting...")
-                break
+        print("\n" + "=" * 50)
+        print("Interactive TTH Demo")
+        print("Type your message and press Enter to send.")
+        print("Type 'quit' to exit.")
+        print("=" * 50 + "\n")
 
-            if not text:
-                continue
-            if text.lower() in ("quit", "exit", "q"):
-                print("Goodbye!")
-                break
+        turn_num = 0
+        ws_url = f"{ws_base}/v1/sessions/{session_id}/stream"
+
+        async with websockets.connect(ws_url) as ws:
+            while True:
+                try:
+                    text = input("> ").strip()
+                except (EOFError, KeyboardInterrupt):
+                    print("\nExiting...")
+                    break
+
+                if not text:
+                    continue
+                if text.lower() in ("quit", "exit", "q"):
+                    print("Goodbye!")
+                    break
 
-            turn_num += 1
-            await run_turn(ws, text, turn_num)
+                turn_num += 1
+                await run_turn(ws, text, turn_num)
 
     print("\nDemo complete!")
 
 
 if __name__ == "__main__":
-    asyncio.run(demo())
+    # Token output is flushed explicitly at event boundaries, not per write/line
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    _run(demo())
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Interactive TTH test - sends text, saves audio to MP3 and video to GIF.
+Interactive TTH test - sends text, saves audio to MP3 and video to MP4 (or GIF).
 
 Usage:
     # Terminal 1: Start server
@@ -8,10 +8,11 @@ Usage:
 
     # Terminal 2: Run test
     uv run python scripts/interactive_test.py "What is machine learning?"
-    # Output: output.mp3, output.gif
+    # Output: output.mp3, output.mp4 (pass --gif for output.gif instead)
 """
 import asyncio
 import base64
+import io
 import json
 import sys
 from pathlib import Path
@@ -25,8 +26,61 @@ except ImportError as e:
     print(f"Missing dep: {e}. Run: uv add httpx websockets pillow numpy")
     sys.exit(1)
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to stdlib
+    _json_loads = json.loads
+
+try:
+    import uvloop
+
+    _run = uvloop.run
+except ImportError:  # uvloop ships with uvicorn[standard]; unavailable on Windows
+    _run = asyncio.run
+
+
+def _video_codec() -> str:
+    """Prefer the platform hardware H.264 encoder when PyAV exposes one."""
+    import av
+
+    if sys.platform == "darwin" and "h264_videotoolbox" in av.codecs_available:
+        return "h264_videotoolbox"
+    return "libx264"
+
 
-async def test(text: str, host: str = "127.0.0.1", port: int = 8000) -> None:
+def save_mp4(path: Path, frames: np.ndarray, fps: int = 25) -> None:
+    """Encode an (N, H, W, 3) uint8 RGB array to H.264 MP4 via libavcodec."""
+    try:
+        import av  # only the MP4 path needs PyAV; --gif works without it
+    except ImportError as e:
+        print(f"Missing dep: {e}. Run: uv add av (or pass --gif)")
+        sys.exit(1)
+
+    with av.open(str(path), mode="w") as container:
+        stream = container.add_stream(_video_codec(), rate=fps)
+        stream.height, stream.width = frames.shape[1:3]
+        stream.pix_fmt = "yuv420p"
+        for rgb in frames:
+            container.mux(stream.encode(av.VideoFrame.from_ndarray(rgb, format="rgb24")))
+        container.mux(stream.encode())  # flush encoder
+
+
+def save_gif(path: Path, frames: np.ndarray) -> None:
+    frames_pil = [Image.fromarray(frame, "RGB") for frame in frames]
+    frames_pil[0].save(
+        path,
+        save_all=True,
+        append_images=frames_pil[1:],
+        duration=40,  # 25 FPS = 40ms per frame
+        loop=0
+    )
+
+
+async def test(
+    text: str, host: str = "127.0.0.1", port: int = 8000, gif: bool = False
+) -> None:
     base_url = f"http://{host}:{port}"
     ws_base = f"ws://{host}:{port}"
 
@@ -38,63 +92,68 @@ async def test(text: str, host: str = "127.0.0.1", port: int = 8000) -> None:
         session_id = r.json()["session_id"]
         print(f"Session: {session_id}")
 
-    # Collect audio and video
-    audio_chunks: list[bytes] = []
-    video_frames: list[tuple[int, bytes]] = []  # (frame_index, rgb_bytes)
+    # Stream audio to disk as it arrives; collect video for GIF assembly
+    audio_path = Path("output.mp3")
+    audio_chunks = 0
+    video_frames: list[tuple[int, str]] = []  # (frame_index, base64 jpeg)
 
     ws_url = f"{ws_base}/v1/sessions/{session_id}/stream"
     async with websockets.connect(ws_url) as ws:
-        await ws.send(json.dumps({
-            "type": "user_text",
-            "text": text,
-            "control": {"emotion": {"label": "happy"}, "character": {}}
-        }))
-        print(f"\nSent: {text}\n")
-        print("Response: ", end="", flush=True)
-
-        async for raw in ws:
-            evt = json.loads(raw)
-            t = evt.get("type")
-
-            if t == "text_delta":
-                print(evt["token"], end="", flush=True)
-            elif t == "audio_chunk":
-                audio_chunks.append(base64.b64decode(evt["data"]))
-            elif t == "video_frame":
-                frame_data = base64.b64decode(evt["data"])
-                video_frames.append((evt["frame_index"], frame_data))
-            elif t == "turn_complete":
-                break
+        with audio_path.open("wb") as audio_f:
+            await ws.send(json.dumps({
+                "type": "user_text",
+                "text": text,
+                "control": {"emotion": {"label": "happy"}, "character": {}}
+            }))
+            print(f"\nSent: {text}\n")
+            print("Response: ", end="", flush=True)
+
+            async for raw in ws:
+                evt = _json_loads(raw)
+                t = evt.get("type")
+
+                if t == "text_delta":
+                    print(evt["token"], end="", flush=True)
+                elif t == "audio_chunk":
+                    audio_f.write(base64.b64decode(evt["data"]))
+                    audio_chunks += 1
+                elif t == "video_frame":
+                    video_frames.append((evt["frame_index"], evt["data"]))
+                elif t == "turn_complete":
+                    break
 
     print("\n")
 
-    # Save audio to MP3
-    audio_path = Path("output.mp3")
-    audio_path.write_bytes(b"".join(audio_chunks))
-    print(f"Saved audio: {audio_path} ({len(audio_chunks)} chunks, {audio_path.stat().st_size} bytes)")
+    print(f"Saved audio: {audio_path} ({audio_chunks} chunks, {audio_path.stat().st_size} bytes)")
 
-    # Save video frames as animated GIF
+    # Save video frames as MP4 (or animated GIF with --gif)
+    video_path = Path("output.gif" if gif else "output.mp4")
     if video_frames:
-        frames_pil: list[Image.Image] = []
-        for idx, rgb_bytes in sorted(video_frames, key=lambda x: x[0]):
-            # raw_rgb is 256x256x3 bytes
-            arr = np.frombuffer(rgb_bytes, dtype=np.uint8).reshape(256, 256, 3)
-            img = Image.fromarray(arr, "RGB")
-            frames_pil.append(img)
-
-        gif_path = Path("output.gif")
-        frames_pil[0].save(
-            gif_path,
-            save_all=True,
-            append_images=frames_pil[1:],
-            duration=40,  # 25 FPS = 40ms per frame
-            loop=0
+        video_frames.sort(key=lambda x: x[0])
+        # Frames are base64 JPEG; decode each into one contiguous (N, H, W, 3) RGB buffer
+        images = (
+            Image.open(io.BytesIO(base64.b64decode(jpeg_b64))).convert("RGB")
+            for _, jpeg_b64 in video_frames
         )
-        print(f"Saved video: {gif_path} ({len(frames_pil)} frames)")
+        first = next(images)
+        buf = np.empty((len(video_frames), first.height, first.width, 3), dtype=np.uint8)
+        buf[0] = np.asarray(first)
+        for i, img in enumerate(images, start=1):
+            if img.size != first.size:  # keep the buffer rectangular if the stream resizes
+                img = img.resize(first.size)
+            buf[i] = np.asarray(img)
+
+        if gif:
+            save_gif(video_path, buf)
+        else:
+            save_mp4(video_path, buf)
+        print(f"Saved video: {video_path} ({len(buf)} frames)")
 
-    print("\nDone! Open output.mp3 and output.gif to see/hear results.")
+    print(f"\nDone! Open {audio_path} and {video_path} to see/hear results.")
 
 
 if __name__ == "__main__":
-    text = " ".join(sys.argv[1:]) or "Hello! Tell me something interesting."
-    asyncio.run(test(text))
+    args = sys.argv[1:]
+    gif = "--gif" in args
+    text = " ".join(a for a in args if a != "--gif") or "Hello! Tell me something interesting."
+    _run(test(text, gif=gif))
@@ -2,23 +2,64 @@
 from __future__ import annotations
 
 import argparse
-import subprocess
+import multiprocessing as mp
+import os
+import runpy
 import sys
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS = ROOT / "scripts"
+
+# Heavy third-party imports shared by every phase. Imported once by the
+# forkserver so each phase child starts with them already loaded. tth.* is
+# deliberately excluded: tth.core.config builds its settings singleton at
+# import time from TTH_PROFILE, which differs between phases.
+_PRELOAD = [
+    "pytest",
+    "fastapi",
+    "fastapi.testclient",
+    "pydantic",
+    "pydantic_settings",
+    "structlog",
+    "websockets",
+    "httpx",
+    "numpy",
+    "scipy.signal",
+    "PIL.Image",
+]
+
+
+def _context() -> mp.context.BaseContext:
+    ctx = mp.get_context("forkserver")
+    ctx.set_forkserver_preload(_PRELOAD)
+    return ctx
+
+
+def _phase_main(script: str) -> None:
+    """Child entry point: run a phase script as __main__ in this process."""
+    os.chdir(ROOT)
+    sys.argv = [str(SCRIPTS / script)]
+    runpy.run_path(str(SCRIPTS / script), run_name="__main__")
+
+
+def _start(script: str) -> mp.process.BaseProcess:
+    proc = _context().Process(target=_phase_main, args=(script,))
+    proc.start()
+    return proc
+
 
 def run_phase(script: str, allow_skip: bool = False) -> None:
-    root = Path(__file__).resolve().parents[1]
-    cmd = [str(root / ".venv" / "bin" / "python"), str(root / "scripts" / script)]
-    print(f"\n=== running {script} ===")
-    proc = subprocess.run(cmd, cwd=root)
-    if proc.returncode == 0:
+    print(f"\n=== running {script} ===", flush=True)
+    proc = _start(script)
+    proc.join()
+    if proc.exitcode == 0:
         print(f"=== {script} PASS ===")
         return
-    if allow_skip and proc.returncode == 2:
+    if allow_skip and proc.exitcode == 2:
         print(f"=== {script} SKIPPED ===")
         return
-    raise SystemExit(proc.returncode)
+    raise SystemExit(proc.exitcode or 1)
 
 
 def main() -> int:
@@ -33,6 +74,9 @@ def main() -> int:
     args = parser.parse_args()
 
     run_phase("phase_01_unit.py")
+    # Phases 02 and 03 are independent, but both open a live openai_realtime
+    # session; run them one at a time so a run never holds two concurrent
+    # Realtime sessions against the same key (rate limits, cost).
     run_phase("phase_02_offline_smoke.py")
     run_phase("phase_03_offline_multiturn.py")
     if args.live:
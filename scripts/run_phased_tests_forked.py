@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Phased test runner that shares one warmed interpreter across offline phases.
+
+Imports the FastAPI app (and with it pydantic, the adapter registry, etc.)
+once under the offline profile, then forks a child per offline phase so each
+child inherits the already-imported modules instead of paying the import cost
+again. Phase 1 (pytest) and phase 4 (different profile) still go through
+run_phased_tests.run_phase, whose forkserver children do not have tth imported.
+
+Forking is only used on Linux; elsewhere this behaves like run_phased_tests.py.
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import runpy
+import sys
+from pathlib import Path
+
+from _phase_common import load_app
+from run_phased_tests import run_phase
+
+SCRIPTS = Path(__file__).resolve().parent
+OFFLINE_PROFILE = "offline_mock"
+
+
+def _run_script(script: str) -> None:
+    runpy.run_path(str(SCRIPTS / script), run_name="__main__")
+
+
+def run_phase_forked(script: str) -> None:
+    print(f"\n=== running {script} (forked) ===")
+    proc = mp.get_context("fork").Process(target=_run_script, args=(script,))
+    proc.start()
+    proc.join()
+    if proc.exitcode == 0:
+        print(f"=== {script} PASS ===")
+        return
+    raise SystemExit(proc.exitcode or 1)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Run phased standalone tests for TTH, forking offline phases "
+        "from a pre-imported interpreter."
+    )
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Include live OpenAI validation phase (requires OPENAI_API_KEY).",
+    )
+    args = parser.parse_args()
+
+    run_phase("phase_01_unit.py")
+
+    offline = ("phase_02_offline_smoke.py", "phase_03_offline_multiturn.py")
+    if sys.platform.startswith("linux"):
+        load_app(OFFLINE_PROFILE)  # warm the import cache before forking
+        for script in offline:
+            run_phase_forked(script)
+    else:
+        for script in offline:
+            run_phase(script)
+
+    if args.live:
+        run_phase("phase_04_live_openai.py", allow_skip=True)
+
+    print("\nAll requested phases completed.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
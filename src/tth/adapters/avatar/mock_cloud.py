@@ -108,6 +108,9 @@ class MockCloudAvatarAdapter(AdapterBase):
         Yields:
             VideoFrame objects timed to match audio duration
         """
+        if not context.get("video_subscribed", True):
+            return
+
         if self._test_frame is None:
             await self.load()
             assert self._test_frame is not None  # load() sets _test_frame
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 import colorsys
 import io
+from functools import lru_cache
 from typing import Any, AsyncIterator
 
 from PIL import Image, ImageDraw
@@ -19,6 +20,11 @@ from tth.core.types import (
 )
 
 _W, _H = 256, 256
+# The test pattern repeats every 100 frames (hue step 0.03, bar wraps at 100),
+# so each distinct frame is encoded once and the same bytes object is reused.
+_PATTERN_PERIOD = 100
+# Spacing between emitted frames so a turn's frames don't reach the client in one burst
+_FRAME_SPACING_S = 0.001
 _frame_counter = 0
 
 
@@ -59,6 +65,12 @@ def _generate_color_frame(hue: float = 0.0, frame_index: int = 0) -> bytes:
     return buffer.getvalue()
 
 
+@lru_cache(maxsize=_PATTERN_PERIOD)
+def _pattern_frame(index: int) -> bytes:
+    """Return the JPEG for position ``index`` in the repeating test pattern."""
+    return _generate_color_frame(index * 0.03, index)
+
+
 @register("stub_avatar")
 class StubAvatarAdapter(AdapterBase):
     """Emits placeholder video frames for testing.
@@ -77,15 +89,18 @@ class StubAvatarAdapter(AdapterBase):
         """Yield frames at configured FPS based on audio duration."""
         global _frame_counter
 
+        if not context.get("video_subscribed", True):
+            return
+
         # Calculate number of frames needed
         frames = max(1, round(input.duration_ms / 1000 * self.fps))
         frame_duration_ms = 1000 / self.fps
         base_idx = context.get("frame_counter", 0)
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
 
         for i in range(frames):
-            # Cycle through colors (hue 0-1)
-            hue = _frame_counter * 0.03
-            jpeg_data = _generate_color_frame(hue, _frame_counter)
+            jpeg_data = _pattern_frame(_frame_counter % _PATTERN_PERIOD)
             _frame_counter += 1
 
             yield VideoFrame(
@@ -96,8 +111,9 @@ class StubAvatarAdapter(AdapterBase):
                 height=_H,
                 content_type="jpeg",
             )
-            # Small delay to not overwhelm the client
-            await asyncio.sleep(0.001)
+            # Pace against a fixed schedule so per-sleep overshoot doesn't accumulate
+            target = t0 + (i + 1) * _FRAME_SPACING_S
+            await asyncio.sleep(max(0.0, target - loop.time()))
 
     async def health(self) -> HealthStatus:
         return HealthStatus(healthy=True, detail="stub adapter — always healthy")
@@ -1,11 +1,12 @@
 # src/tth/adapters/realtime/openai_realtime.py
 from __future__ import annotations
 import asyncio
-import base64
 import json
 import logging
 import time
-from typing import Any, AsyncIterator
+from binascii import a2b_base64 as _b64decode  # skips the base64 module's wrapper layer
+from collections import deque
+from typing import Any, AsyncIterator, Callable
 import websockets
 from tth.adapters.base import AdapterBase
 from tth.core.config import settings
@@ -22,6 +23,32 @@ from tth.core.types import (
 )
 
 logger = logging.getLogger(__name__)
+_monotonic = time.monotonic
+
+_loads: Callable[[str | bytes], Any]
+_dumps: Callable[[Any], str]
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _orjson_dumps(obj: Any) -> str:
+        # Realtime API expects text frames; orjson returns bytes
+        return orjson.dumps(obj).decode()
+
+    _dumps = _orjson_dumps
+
+except ImportError:  # orjson is optional; fall back to stdlib
+    _loads = json.loads
+    _dumps = json.dumps
+
+# Realtime server events lead with their type, e.g. {"type":"response.done",...}
+_TYPE_PREFIX = b'{"type":"'
+
+# Constant control frames, serialized once
+_RESPONSE_CREATE_FRAME = _dumps({"type": "response.create"})
+_RESPONSE_CANCEL_FRAME = _dumps({"type": "response.cancel"})
 
 
 @register("openai_realtime")
@@ -36,14 +63,33 @@ class OpenAIRealtimeAdapter(AdapterBase):
     """
 
     _WS_URL = "wss://api.openai.com/v1/realtime"
+    _MS_PER_BYTE = 1000.0 / (2 * 24000)  # pcm16 mono at 24kHz
 
     def __init__(self, config: dict[str, Any] | None = None) -> None:
         super().__init__(config or {})
         self._ws: Any = None
-        self._event_queue: asyncio.Queue[Any] = asyncio.Queue()
+        # Single-consumer event pipe: listener appends, stream_events pops and
+        # parks on _event_waiter only when the buffer is empty.
+        self._events: deque[Any] = deque()
+        self._event_waiter: asyncio.Future[None] | None = None
         self._listener_task: asyncio.Task[None] | None = None
         self._is_connected = False
         self._connect_time: float = 0
+        # Media timeline for the current response: anchored to the clock on the
+        # first audio delta, then advanced by each chunk's duration.
+        self._audio_wall_ms: float | None = None
+        # "response.audio.*" names are current; "response.output_audio.*" cover
+        # earlier beta versions of the Realtime API.
+        self._dispatch: dict[str, Callable[[dict[str, Any]], None]] = {
+            "response.audio.delta": self._on_audio_delta,
+            "response.output_audio.delta": self._on_audio_delta,
+            "response.audio_transcript.delta": self._on_transcript_delta,
+            "response.output_audio_transcript.delta": self._on_transcript_delta,
+            "response.done": self._on_response_done,
+            "error": self._on_error,
+            "session.updated": self._on_session_updated,
+        }
+        self._dispatch_keys = frozenset(k.encode() for k in self._dispatch)
 
     async def connect(self, system_instructions: str, voice: str = "alloy") -> None:
         """Establish WebSocket connection ONCE at session start."""
@@ -57,6 +103,9 @@ class OpenAIRealtimeAdapter(AdapterBase):
             self._ws = await websockets.connect(
                 url,
                 additional_headers={"Authorization": f"Bearer {settings.openai_api_key}"},
+                # Keepalive pings hold the socket open through idle gaps between turns
+                ping_interval=self.config.get("ping_interval_s", 20.0),
+                ping_timeout=self.config.get("ping_timeout_s", 20.0),
             )
             self._connect_time = time.monotonic()
 
@@ -75,11 +124,11 @@ class OpenAIRealtimeAdapter(AdapterBase):
                     "tool_choice": "auto",
                 },
             }
-            await self._ws.send(json.dumps(session_update))
+            await self._ws.send(_dumps(session_update))
 
             # Wait for session.created event
             response = await asyncio.wait_for(self._ws.recv(), timeout=10.0)
-            event = json.loads(response)
+            event = _loads(response)
             if event.get("type") != "session.created":
                 raise RuntimeError(f"Expected session.created, got {event.get('type')}")
 
@@ -98,11 +147,16 @@ class OpenAIRealtimeAdapter(AdapterBase):
     async def _listen(self) -> None:
         """Background task: listen for WebSocket messages and queue events."""
         try:
-            if self._ws is None:
+            ws = self._ws
+            if ws is None:
                 return
-            async for message in self._ws:
-                event = json.loads(message)
-                await self._handle_server_event(event)
+            while True:
+                # Raw bytes go straight to the JSON parser; no intermediate str decode
+                message = await ws.recv(decode=False)
+                if self._is_ignorable(message):
+                    continue
+                event = _loads(message)
+                self._handle_server_event(event)
         except websockets.ConnectionClosed as e:
             logger.warning(f"Realtime WebSocket connection closed: code={e.code}")
             self._is_connected = False
@@ -113,54 +167,69 @@ class OpenAIRealtimeAdapter(AdapterBase):
             logger.error(f"Realtime listener error: {e}")
             self._is_connected = False
 
-    async def _handle_server_event(self, event: dict[str, Any]) -> None:
+    def _is_ignorable(self, message: bytes) -> bool:
+        """True if the frame is a known-unhandled event type, judged without parsing.
+
+        Only frames that open with the top-level "type" key are probed; anything
+        else (and everything at DEBUG, where unhandled types are logged) is parsed.
+        """
+        if not message.startswith(_TYPE_PREFIX) or logger.isEnabledFor(logging.DEBUG):
+            return False
+        end = message.find(b'"', len(_TYPE_PREFIX))
+        return end != -1 and message[len(_TYPE_PREFIX) : end] not in self._dispatch_keys
+
+    def _handle_server_event(self, event: dict[str, Any]) -> None:
         """Convert Realtime API events to internal events."""
-        event_type = event.get("type")
-
-        if event_type in ("response.audio.delta", "response.output_audio.delta"):
-            # Audio output chunk - base64 encoded PCM.
-            # "response.audio.delta" is the current OpenAI Realtime API name;
-            # "response.output_audio.delta" was used in some earlier beta versions.
-            audio_b64 = event.get("delta", "")
-            if audio_b64:
-                audio_data = base64.b64decode(audio_b64)
-                duration_ms = len(audio_data) / 2 / 24000 * 1000  # 16-bit, 24kHz
-                await self._event_queue.put(
-                    AudioChunkEvent(
-                        data=audio_data,
-                        timestamp_ms=time.monotonic() * 1000,
-                        duration_ms=duration_ms,
-                        encoding="pcm",
-                        sample_rate=24000,
-                    )
+        event_type: str = event.get("type", "")
+        handler = self._dispatch.get(event_type)
+        if handler is None:
+            logger.debug(f"Realtime event (unhandled): {event_type}")
+            return
+        handler(event)
+
+    def _on_audio_delta(self, event: dict[str, Any]) -> None:
+        # Audio output chunk - base64 encoded PCM.
+        audio_b64 = event.get("delta", "")
+        if audio_b64:
+            audio_data = _b64decode(audio_b64)
+            duration_ms = len(audio_data) * self._MS_PER_BYTE
+            timestamp_ms = self._audio_wall_ms
+            if timestamp_ms is None:
+                timestamp_ms = _monotonic() * 1000
+            self._audio_wall_ms = timestamp_ms + duration_ms
+            self._push_event(
+                AudioChunkEvent(
+                    data=audio_data,
+                    timestamp_ms=timestamp_ms,
+                    duration_ms=duration_ms,
+                    encoding="pcm",
+                    sample_rate=24000,
                 )
+            )
 
-        elif event_type in (
-            "response.audio_transcript.delta",
-            "response.output_audio_transcript.delta",
-        ):
-            # Text transcript delta.
-            # "response.audio_transcript.delta" is the current name;
-            # "response.output_audio_transcript.delta" covers earlier beta versions.
-            text_delta = event.get("delta", "")
-            if text_delta:
-                await self._event_queue.put(TextDeltaEvent(token=text_delta))
-
-        elif event_type == "response.done":
-            # Response complete
-            response = event.get("response", {})
-            response_id = response.get("id", "unknown")
-            await self._event_queue.put(TurnCompleteEvent(turn_id=response_id))
-
-        elif event_type == "error":
-            error = event.get("error", {})
-            logger.error(f"Realtime API error: {error}")
-
-        elif event_type == "session.updated":
-            logger.debug("Realtime session updated")
-
-        else:
-            logger.debug(f"Realtime event (unhandled): {event_type}")
+    def _on_transcript_delta(self, event: dict[str, Any]) -> None:
+        text_delta = event.get("delta", "")
+        if text_delta:
+            self._push_event(TextDeltaEvent(token=text_delta))
+
+    def _on_response_done(self, event: dict[str, Any]) -> None:
+        response = event.get("response", {})
+        response_id = response.get("id", "unknown")
+        self._audio_wall_ms = None
+        self._push_event(TurnCompleteEvent(turn_id=response_id))
+
+    def _on_error(self, event: dict[str, Any]) -> None:
+        error = event.get("error", {})
+        logger.error(f"Realtime API error: {error}")
+
+    def _on_session_updated(self, event: dict[str, Any]) -> None:
+        logger.debug("Realtime session updated")
+
+    def _push_event(self, event: Any) -> None:
+        self._events.append(event)
+        waiter = self._event_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
 
     async def send_user_text(self, text: str) -> None:
         """Send user message and trigger response."""
@@ -176,28 +245,54 @@ class OpenAIRealtimeAdapter(AdapterBase):
                 "content": [{"type": "input_text", "text": text}],
             },
         }
-        await self._ws.send(json.dumps(item))
+        await self._ws.send(_dumps(item))
 
         # Trigger response generation
-        await self._ws.send(json.dumps({"type": "response.create"}))
+        await self._ws.send(_RESPONSE_CREATE_FRAME)
         logger.debug(f"Sent user text and triggered response: {text[:50]}...")
 
     async def cancel_response(self) -> None:
         """Cancel current response (for interrupt handling)."""
         if self._is_connected and self._ws is not None:
-            await self._ws.send(json.dumps({"type": "response.cancel"}))
+            await self._ws.send(_RESPONSE_CANCEL_FRAME)
             logger.info("Sent response.cancel to Realtime API")
-            # Clear any pending events from queue
-            while not self._event_queue.empty():
-                try:
-                    self._event_queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    break
+            # Clear any pending events from the buffer
+            self._events.clear()
+            self._audio_wall_ms = None
 
     async def stream_events(self) -> AsyncIterator[AudioChunkEvent | TextDeltaEvent | TurnCompleteEvent]:
-        """Yield events from the response queue until TurnCompleteEvent."""
+        """Yield buffered response events until TurnCompleteEvent.
+
+        Text or audio deltas that are already queued back-to-back are merged
+        into one event, so a burst reaches the orchestrator (and the avatar) as
+        a single chunk. Nothing is held back waiting for more deltas.
+        """
+        events = self._events
         while True:
-            event = await self._event_queue.get()
+            while not events:
+                self._event_waiter = asyncio.get_running_loop().create_future()
+                await self._event_waiter
+            self._event_waiter = None
+            event = events.popleft()
+            if isinstance(event, TextDeltaEvent):
+                tokens = [event.token]
+                while events and isinstance(events[0], TextDeltaEvent):
+                    tokens.append(events.popleft().token)
+                if len(tokens) > 1:
+                    event = TextDeltaEvent(token="".join(tokens))
+            elif isinstance(event, AudioChunkEvent) and events and isinstance(
+                events[0], AudioChunkEvent
+            ):
+                run = [event]
+                while events and isinstance(events[0], AudioChunkEvent):
+                    run.append(events.popleft())
+                event = AudioChunkEvent(
+                    data=b"".join(c.data for c in run),
+                    timestamp_ms=event.timestamp_ms,
+                    duration_ms=sum(c.duration_ms for c in run),
+                    encoding=event.encoding,
+                    sample_rate=event.sample_rate,
+                )
             yield event
             if isinstance(event, TurnCompleteEvent):
                 break
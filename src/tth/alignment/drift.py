@@ -18,18 +18,22 @@ class DriftController:
     def __init__(self, window: int = 10) -> None:
         self._window = window
         self._history: deque[float] = deque(maxlen=window)
+        self._sum = 0.0  # running sum of _history so the mean is O(1)
 
     def update(self, audio_ts_ms: float, video_ts_ms: float) -> float:
         """Record a new timestamp pair and return current drift in ms."""
         drift = video_ts_ms - audio_ts_ms
+        if len(self._history) == self._window:
+            self._sum -= self._history[0]
         self._history.append(drift)
+        self._sum += drift
         return drift
 
     @property
     def mean_drift_ms(self) -> float:
         if not self._history:
             return 0.0
-        return sum(self._history) / len(self._history)
+        return self._sum / len(self._history)
 
     @property
     def max_drift_ms(self) -> float:
@@ -39,6 +43,7 @@ class DriftController:
 
     def reset(self) -> None:
         self._history.clear()
+        self._sum = 0.0
 
     def is_within_budget(self, budget_ms: float = 80.0) -> bool:
         """Returns True if mean drift is within the acceptable budget."""
@@ -1,5 +1,6 @@
 # src/tth/api/main.py
 from __future__ import annotations
+import asyncio
 from pathlib import Path
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
@@ -37,16 +38,6 @@ async def lifespan(app: FastAPI):
     )
     avatar_adapter = registry.create(avatar_cfg.get("primary", "stub_avatar"), avatar_cfg)
 
-    # Load adapters
-    await realtime_adapter.load()
-    await avatar_adapter.load()
-
-    log.info(
-        "adapters loaded",
-        realtime=realtime_cfg.get("primary", "openai_realtime"),
-        avatar=avatar_cfg.get("primary", "stub_avatar"),
-    )
-
     # Get persona defaults for initial connection
     persona_id = "default"
     persona_defaults = get_persona_defaults(persona_id)
@@ -59,9 +50,20 @@ async def lifespan(app: FastAPI):
     )
     voice = map_emotion_to_realtime_voice(persona_defaults.emotion)
 
-    # Connect to Realtime API once at startup
-    await realtime_adapter.connect(system_instructions, voice)
-    log.info("Realtime API connected", voice=voice)
+    async def _start_realtime() -> None:
+        await realtime_adapter.load()
+        # Connect to Realtime API once at startup
+        await realtime_adapter.connect(system_instructions, voice)
+        log.info("Realtime API connected", voice=voice)
+
+    # Independent startup I/O: Realtime handshake overlaps the avatar load
+    await asyncio.gather(_start_realtime(), avatar_adapter.load())
+
+    log.info(
+        "adapters loaded",
+        realtime=realtime_cfg.get("primary", "openai_realtime"),
+        avatar=avatar_cfg.get("primary", "stub_avatar"),
+    )
 
     # Wire up orchestrator + session manager
     orch = Orchestrator(realtime=realtime_adapter, avatar=avatar_adapter)
@@ -2,7 +2,9 @@
 from __future__ import annotations
 import asyncio
 import json
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from typing import TYPE_CHECKING, Annotated, Any, Awaitable, Callable, Union
+from fastapi import APIRouter, Response, WebSocket, WebSocketDisconnect
+from pydantic import Field, TypeAdapter
 from tth.api.schemas import (
     CreateSessionRequest,
     CreateSessionResponse,
@@ -10,20 +12,34 @@ from tth.api.schemas import (
     ModelsResponse,
 )
 from tth.core.types import (
+    AudioChunkEvent,
     InterruptEvent,
     UserTextEvent,
     ControlUpdateEvent,
     ErrorEvent,
+    TextDeltaEvent,
+    TurnControl,
+    VideoFrameEvent,
 )
 from tth.control.mapper import merge_controls
 from tth.core.logging import get_logger
 
+if TYPE_CHECKING:
+    from tth.pipeline.orchestrator import Orchestrator
+    from tth.pipeline.session import Session
+
 router = APIRouter()
 _log = get_logger(__name__)
 
+# Opt-in WS subprotocol: media events go out as a JSON header frame (the event
+# without "data") followed by one binary frame holding the raw payload.
+BINARY_SUBPROTOCOL = "tth.binary.v1"
+
 # These are set by main.py at startup
 _session_manager = None
 _orchestrator = None
+# Adapter capabilities are fixed for a given orchestrator, so /v1/models is encoded once
+_models_json: str | None = None
 
 
 def set_session_manager(sm) -> None:
@@ -32,8 +48,9 @@ def set_session_manager(sm) -> None:
 
 
 def set_orchestrator(orch) -> None:
-    global _orchestrator
+    global _orchestrator, _models_json
     _orchestrator = orch
+    _models_json = None
 
 
 def get_session_manager():
@@ -72,18 +89,52 @@ async def session_stream(ws: WebSocket, session_id: str):
         await ws.close(code=4004, reason="Session not found")
         return
 
-    output_q: asyncio.Queue = asyncio.Queue(maxsize=64)
-    await ws.accept()
+    output_q: asyncio.Queue[Any] = asyncio.Queue(maxsize=64)
+    binary = BINARY_SUBPROTOCOL in ws.scope.get("subprotocols", ())
+    await ws.accept(subprotocol=BINARY_SUBPROTOCOL if binary else None)
 
     # Start persistent avatar relay (no-op for pull-model adapters)
     await orch.start_session(session, output_q)
 
     # ── Outbound: relay events to client; keep alive across turns ────────────
     async def send_loop() -> None:
+        pending = None  # event of another kind pulled while draining a run
         while True:
-            event = await output_q.get()
+            if pending is not None:
+                event, pending = pending, None
+            else:
+                event = await output_q.get()
             try:
-                await ws.send_text(event.model_dump_json())
+                if isinstance(event, TextDeltaEvent):
+                    # Deltas already queued back-to-back go out as one text frame
+                    tokens = [event.token]
+                    while not output_q.empty():
+                        nxt = output_q.get_nowait()
+                        if not isinstance(nxt, TextDeltaEvent):
+                            pending = nxt
+                            break
+                        tokens.append(nxt.token)
+                    if len(tokens) > 1:
+                        event = TextDeltaEvent(token="".join(tokens))
+                    await ws.send_text(event.model_dump_json())
+                    continue
+                if binary and isinstance(event, VideoFrameEvent):
+                    # Frames already queued back-to-back share one header + one payload
+                    batch = [event]
+                    while not output_q.empty():
+                        nxt = output_q.get_nowait()
+                        if not isinstance(nxt, VideoFrameEvent):
+                            pending = nxt
+                            break
+                        batch.append(nxt)
+                    if len(batch) > 1:
+                        await _send_frame_batch(ws, batch)
+                        continue
+                if binary and isinstance(event, (AudioChunkEvent, VideoFrameEvent)):
+                    await ws.send_text(event.model_dump_json(exclude={"data"}))
+                    await ws.send_bytes(event.data)
+                else:
+                    await ws.send_text(event.model_dump_json())
             except WebSocketDisconnect:
                 return
             except Exception as e:
@@ -95,47 +146,8 @@ async def session_stream(ws: WebSocket, session_id: str):
         try:
             async for raw in ws.iter_text():
                 evt = _parse_inbound(raw)
-                if evt is None:
-                    continue
-
-                if isinstance(evt, UserTextEvent):
-                    # Cancel any running turn, then start the new one.
-                    await session.cancel_current_turn()
-
-                    # Merge pending_control (from prior ControlUpdateEvent) with
-                    # this turn's control, then clear pending so it isn't double-applied.
-                    effective_control = (
-                        merge_controls(session.pending_control, evt.control)
-                        if session.pending_control is not None
-                        else evt.control
-                    )
-                    session.pending_control = None
-
-                    # Capture loop-local copies to avoid closure-over-loop-var bugs
-                    _text = evt.text
-                    _control = effective_control
-
-                    async def _run(text=_text, control=_control) -> None:
-                        try:
-                            await orch.run_turn(session, text, control, output_q)
-                        except asyncio.CancelledError:
-                            pass  # clean interrupt; no error event needed
-                        except Exception as exc:
-                            await output_q.put(ErrorEvent(code="turn_error", message=str(exc)))
-
-                    session.current_turn_task = asyncio.create_task(_run())
-
-                elif isinstance(evt, InterruptEvent):
-                    # Cancel the turn task
-                    await session.cancel_current_turn()
-                    # Also cancel the Realtime API response
-                    await orch.realtime.cancel_response()
-                    # Clear avatar buffers
-                    await orch.avatar.interrupt()
-
-                elif isinstance(evt, ControlUpdateEvent):
-                    # Stored; will be merged into the control of the next UserTextEvent
-                    session.pending_control = evt.control
+                if evt is not None:
+                    await _INBOUND_HANDLERS[type(evt)](evt, session, orch, output_q)
 
         except WebSocketDisconnect:
             pass
@@ -152,42 +164,121 @@ async def session_stream(ws: WebSocket, session_id: str):
         sm.close(session_id)
 
 
+# ── Inbound event handlers ────────────────────────────────────────────────────
+
+
+async def _on_user_text(
+    evt: UserTextEvent, session: Session, orch: Orchestrator, output_q: asyncio.Queue[Any]
+) -> None:
+    # Cancel any running turn, then start the new one.
+    await session.cancel_current_turn()
+
+    # Merge pending_control (from prior ControlUpdateEvent) with
+    # this turn's control, then clear pending so it isn't double-applied.
+    control = (
+        merge_controls(session.pending_control, evt.control)
+        if session.pending_control is not None
+        else evt.control
+    )
+    session.pending_control = None
+
+    session.current_turn_task = asyncio.create_task(
+        _run_turn(orch, session, evt.text, control, output_q, frozenset(evt.types))
+    )
+
+
+async def _run_turn(
+    orch: Orchestrator,
+    session: Session,
+    text: str,
+    control: TurnControl,
+    output_q: asyncio.Queue[Any],
+    types: frozenset[str],
+) -> None:
+    try:
+        await orch.run_turn(session, text, control, output_q, types)
+    except asyncio.CancelledError:
+        pass  # clean interrupt; no error event needed
+    except Exception as exc:
+        await output_q.put(ErrorEvent(code="turn_error", message=str(exc)))
+
+
+async def _on_interrupt(
+    evt: InterruptEvent, session: Session, orch: Orchestrator, output_q: asyncio.Queue[Any]
+) -> None:
+    # Cancel the turn task
+    await session.cancel_current_turn()
+    # Also cancel the Realtime API response
+    await orch.realtime.cancel_response()
+    # Clear avatar buffers
+    await orch.avatar.interrupt()
+
+
+async def _on_control_update(
+    evt: ControlUpdateEvent, session: Session, orch: Orchestrator, output_q: asyncio.Queue[Any]
+) -> None:
+    # Stored; will be merged into the control of the next UserTextEvent
+    session.pending_control = evt.control
+
+
+# Exact-type dispatch: _parse_inbound only ever returns these three classes
+_INBOUND_HANDLERS: dict[type, Callable[..., Awaitable[None]]] = {
+    UserTextEvent: _on_user_text,
+    InterruptEvent: _on_interrupt,
+    ControlUpdateEvent: _on_control_update,
+}
+
+
 # ── Utility endpoints ─────────────────────────────────────────────────────────
 
 
 @router.get("/v1/health", response_model=HealthResponse)
 async def health():
     orch = get_orchestrator()
-    return HealthResponse(
-        llm=await orch.realtime.health(),  # Realtime serves as combined LLM+TTS
-        tts=await orch.realtime.health(),
-        avatar=await orch.avatar.health(),
-    )
+    realtime = await orch.realtime.health()  # Realtime serves as combined LLM+TTS
+    body = HealthResponse(llm=realtime, tts=realtime, avatar=await orch.avatar.health())
+    # Serialize directly; skips FastAPI's jsonable_encoder + response_model revalidation
+    return Response(content=body.model_dump_json(), media_type="application/json")
 
 
 @router.get("/v1/models", response_model=ModelsResponse)
 async def models():
-    orch = get_orchestrator()
-    return ModelsResponse(
-        llm=orch.realtime.capabilities(),  # Realtime serves as combined LLM+TTS
-        tts=orch.realtime.capabilities(),
-        avatar=orch.avatar.capabilities(),
-    )
+    global _models_json
+    if _models_json is None:
+        orch = get_orchestrator()
+        _models_json = ModelsResponse(
+            llm=orch.realtime.capabilities(),  # Realtime serves as combined LLM+TTS
+            tts=orch.realtime.capabilities(),
+            avatar=orch.avatar.capabilities(),
+        ).model_dump_json()
+    return Response(content=_models_json, media_type="application/json")
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
 
+# Parses and validates in one pass inside pydantic-core, dispatching on "type"
+_INBOUND = TypeAdapter(
+    Annotated[
+        Union[UserTextEvent, InterruptEvent, ControlUpdateEvent],
+        Field(discriminator="type"),
+    ]
+)
+
+
+async def _send_frame_batch(ws: WebSocket, frames: list[VideoFrameEvent]) -> None:
+    header = {
+        "type": "video_frame_batch",
+        "frames": [f.model_dump(exclude={"data"}) for f in frames],
+        "sizes": [len(f.data) for f in frames],
+    }
+    await ws.send_text(json.dumps(header))
+    await ws.send_bytes(b"".join(f.data for f in frames))
+
+
 def _parse_inbound(raw: str):
     try:
-        data = json.loads(raw)
-        t = data.get("type")
-        if t == "user_text":
-            return UserTextEvent(**data)
-        if t == "interrupt":
-            return InterruptEvent(**data)
-        if t == "control_update":
-            return ControlUpdateEvent(**data)
+        return _INBOUND.validate_json(raw)
     except Exception as exc:
         _log.debug("failed to parse inbound message", error=str(exc))
     return None
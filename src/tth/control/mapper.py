@@ -8,6 +8,33 @@ from tth.core.types import (
 )
 
 
+# Shared "unset" sentinels; the control models are frozen, so reuse is safe
+_DEFAULT_EMOTION = EmotionControl()
+_DEFAULT_CHARACTER = CharacterControl()
+
+
+def _emotion_is_default(e: EmotionControl) -> bool:
+    # Field checks instead of model __eq__, which walks and compares the full __dict__
+    d = _DEFAULT_EMOTION
+    return e is d or (
+        e.label is d.label
+        and e.intensity == d.intensity
+        and e.valence == d.valence
+        and e.arousal == d.arousal
+    )
+
+
+def _character_is_default(c: CharacterControl) -> bool:
+    d = _DEFAULT_CHARACTER
+    return c is d or (
+        c.persona_id == d.persona_id
+        and c.speech_rate == d.speech_rate
+        and c.pitch_shift == d.pitch_shift
+        and c.expressivity == d.expressivity
+        and c.motion_gain == d.motion_gain
+    )
+
+
 # ── LLM system prompt injection ───────────────────────────────────────────────
 
 
@@ -40,9 +67,12 @@ def resolve(user_control: TurnControl, persona_defaults: TurnControl) -> TurnCon
     Merge user-supplied controls with persona defaults.
     User values win; fall back to persona defaults for unset fields.
     A field is considered "unset" if it equals the type default.
+    When nothing is set, persona_defaults itself is returned (not a copy).
     """
-    user_emotion_is_default = user_control.emotion == EmotionControl()
+    user_emotion_is_default = _emotion_is_default(user_control.emotion)
     user_character_is_default = user_control.character.persona_id == "default"
+    if user_emotion_is_default and user_character_is_default:
+        return persona_defaults
     return TurnControl(
         emotion=(persona_defaults.emotion if user_emotion_is_default else user_control.emotion),
         character=(
@@ -57,24 +87,24 @@ def merge_controls(base: TurnControl, override: TurnControl) -> TurnControl:
     Override fields win over base; base fills in defaults.
     Called in routes.py to apply ControlUpdateEvent on the next turn.
     """
-    base_emotion_is_default = base.emotion == EmotionControl()
-    base_character_is_default = base.character == CharacterControl()
-    over_emotion_is_default = override.emotion == EmotionControl()
-    over_character_is_default = override.character == CharacterControl()
+    base_emotion_is_default = _emotion_is_default(base.emotion)
+    base_character_is_default = _character_is_default(base.character)
+    over_emotion_is_default = _emotion_is_default(override.emotion)
+    over_character_is_default = _character_is_default(override.character)
     return TurnControl(
         emotion=(
             override.emotion
             if not over_emotion_is_default
             else base.emotion
             if not base_emotion_is_default
-            else EmotionControl()
+            else _DEFAULT_EMOTION
         ),
         character=(
             override.character
             if not over_character_is_default
             else base.character
             if not base_character_is_default
-            else CharacterControl()
+            else _DEFAULT_CHARACTER
         ),
     )
 
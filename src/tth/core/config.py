@@ -20,6 +20,29 @@ def deep_merge(base: dict, override: dict) -> dict:
     return result
 
 
+# libyaml's C loader when PyYAML was built with it; same safe subset either way
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _read_yaml(path: Path) -> dict[str, Any]:
+    data: dict[str, Any] = yaml.load(path.read_text(), Loader=_YamlLoader) or {}
+    return data
+
+
+def _load_profile(search_root: Path, profile: str) -> dict[str, Any] | None:
+    """Parse base.yaml merged with the profile under search_root, or None if absent."""
+    base_path = search_root / "config" / "base.yaml"
+    if not base_path.exists():
+        return None
+    cfg = _read_yaml(base_path)
+    profile_path = search_root / "config" / "profiles" / f"{profile}.yaml"
+    if profile_path.exists():
+        profile_data = _read_yaml(profile_path)
+        if profile_data:
+            cfg = deep_merge(cfg, profile_data)
+    return cfg
+
+
 class AppConfig(BaseModel):
     host: str = "0.0.0.0"
     port: int = 8000
@@ -53,14 +76,8 @@ class Settings(BaseSettings):
         profile = os.getenv("TTH_PROFILE", values.get("profile", ""))
         # Look for config relative to cwd or project root
         for search_root in [Path.cwd(), Path(__file__).parent.parent.parent.parent.parent]:
-            base_path = search_root / "config" / "base.yaml"
-            if base_path.exists():
-                cfg: dict = yaml.safe_load(base_path.read_text()) or {}
-                profile_path = search_root / "config" / "profiles" / f"{profile}.yaml"
-                if profile_path.exists():
-                    profile_data = yaml.safe_load(profile_path.read_text()) or {}
-                    if profile_data:
-                        cfg = deep_merge(cfg, profile_data)
+            cfg = _load_profile(search_root, profile)
+            if cfg is not None:
                 # YAML values have lowest priority — env vars override them
                 return {**cfg, **values}
         # No config found — use defaults
@@ -1,9 +1,9 @@
 # src/tth/core/types.py
 from __future__ import annotations
-import base64
+import binascii
 from enum import Enum
 from typing import Literal
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
 # ── Controls ──────────────────────────────────────────────────────────────────
@@ -20,6 +20,9 @@ class EmotionLabel(str, Enum):
 
 
 class EmotionControl(BaseModel):
+    # Frozen so default instances can be shared (see control.mapper)
+    model_config = ConfigDict(frozen=True)
+
     label: EmotionLabel = EmotionLabel.NEUTRAL
     intensity: float = Field(0.5, ge=0.0, le=1.0)
     valence: float = Field(0.0, ge=-1.0, le=1.0)  # -1=negative  +1=positive
@@ -27,6 +30,8 @@ class EmotionControl(BaseModel):
 
 
 class CharacterControl(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     persona_id: str = "default"
     speech_rate: float = Field(1.0, ge=0.25, le=4.0)
     pitch_shift: float = Field(0.0, ge=-1.0, le=1.0)
@@ -54,13 +59,12 @@ class AudioChunk(BaseModel):
 
 def estimate_mp3_duration_ms(data: bytes, bitrate_kbps: int = 128) -> float:
     """Duration of raw MP3 bytes at a known constant bitrate."""
-    return (len(data) * 8) / (bitrate_kbps * 1000) * 1000
+    return len(data) * 8 / bitrate_kbps  # kbps == bits per millisecond
 
 
 def estimate_pcm_duration_ms(data: bytes, sample_rate: int = 24000) -> float:
     """Duration of raw PCM bytes (16-bit mono)."""
-    samples = len(data) / 2  # 16-bit = 2 bytes per sample
-    return (samples / sample_rate) * 1000
+    return len(data) * 500 / sample_rate  # 2 bytes per sample, 1000 ms per s
 
 
 class VideoFrame(BaseModel):
@@ -116,7 +120,7 @@ class AudioChunkEvent(BaseModel):
 
     @field_serializer("data")
     def _encode_data(self, v: bytes) -> str:
-        return base64.b64encode(v).decode()
+        return binascii.b2a_base64(v, newline=False).decode("ascii")
 
 
 class VideoFrameEvent(BaseModel):
@@ -135,7 +139,7 @@ class VideoFrameEvent(BaseModel):
 
     @field_serializer("data")
     def _encode_data(self, v: bytes) -> str:
-        return base64.b64encode(v).decode()
+        return binascii.b2a_base64(v, newline=False).decode("ascii")
 
 
 class TurnCompleteEvent(BaseModel):
@@ -152,10 +156,20 @@ class ErrorEvent(BaseModel):
 # ── Events (inbound from client) ─────────────────────────────────────────────
 
 
+OutputStream = Literal["text", "audio", "video"]
+
+
+def _all_output_streams() -> list[OutputStream]:
+    return ["text", "audio", "video"]
+
+
 class UserTextEvent(BaseModel):
     type: Literal["user_text"] = "user_text"
     text: str
     control: TurnControl = Field(default_factory=TurnControl)
+    # Output streams the client wants for this turn; omitted streams are not sent.
+    # Push-model avatar relays follow the latest turn's "video" choice until the next turn.
+    types: list[OutputStream] = Field(default_factory=_all_output_streams)
 
 
 class InterruptEvent(BaseModel):
@@ -2,7 +2,8 @@
 from __future__ import annotations
 import asyncio
 import logging
-from typing import Any
+import time
+from typing import Any, Collection
 from tth.adapters.base import AdapterBase
 from tth.adapters.realtime.openai_realtime import OpenAIRealtimeAdapter
 from tth.control.mapper import resolve as resolve_controls
@@ -13,7 +14,7 @@ from tth.core.types import (
     TurnControl,
     VideoFrameEvent,
 )
-from tth.pipeline.session import Session
+from tth.pipeline.session import Session, SessionState
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +59,8 @@ class Orchestrator:
             nonlocal frame_counter
             try:
                 async for frame in self.avatar.relay_frames(stop_never):
+                    if not session.video_subscribed:
+                        continue  # client left "video" out of its latest turn
                     drift = session.drift_controller.update(
                         session.last_audio_ts[0], frame.timestamp_ms
                     )
@@ -92,6 +95,7 @@ class Orchestrator:
         text: str,
         control: TurnControl,
         output_q: asyncio.Queue[Any],
+        types: Collection[str] = ("text", "audio", "video"),
     ) -> None:
         resolved = resolve_controls(control, session.persona_defaults)
 
@@ -115,22 +119,27 @@ class Orchestrator:
 
         frame_counter = 0
         full_response: list[str] = []
+        send_text = "text" in types
+        send_audio = "audio" in types
+        video_subscribed = "video" in types
+        session.video_subscribed = video_subscribed
+        audio_started = False
 
         is_push = self.avatar.capabilities().has_streaming_frames
         avatar_q: asyncio.Queue[tuple[AudioChunk, float] | None] = asyncio.Queue(maxsize=32)
 
         if is_push:
             async def _feed_audio() -> None:
+                ctx = {**session.context, "session_id": session.id}
                 while True:
                     item = await avatar_q.get()
                     if item is None:
                         break
-                    audio_chunk, audio_ts = item
-                    session.last_audio_ts[0] = audio_ts
-                    ctx = {
-                        **session.context,
-                        "session_id": session.id,
-                    }
+                    audio_chunk, _ = item
+                    # Simli stamps frames with wall-clock arrival time, so drift is
+                    # measured against when the audio was fed, not its media timestamp
+                    # (which runs ahead of the clock while Realtime bursts audio).
+                    session.last_audio_ts[0] = time.monotonic() * 1000
                     async for _ in self.avatar.infer_stream(audio_chunk, resolved, ctx):
                         pass  # yields nothing for push model
 
@@ -140,47 +149,61 @@ class Orchestrator:
             # Pull model: existing sequential worker (stub/mock adapters)
             async def _avatar_worker() -> None:
                 nonlocal frame_counter
+                # Built once per turn; only frame_counter changes between chunks
+                ctx = {
+                    **session.context,
+                    "frame_counter": frame_counter,
+                    "session_id": session.id,
+                    "video_subscribed": video_subscribed,
+                }
                 while True:
                     item = await avatar_q.get()
                     if item is None:
                         break
                     audio_chunk, audio_ts = item
-                    ctx = {
-                        **session.context,
-                        "frame_counter": frame_counter,
-                        "session_id": session.id,
-                    }
+                    ctx["frame_counter"] = frame_counter
                     async for frame in self.avatar.infer_stream(audio_chunk, resolved, ctx):
                         drift = session.drift_controller.update(audio_ts, frame.timestamp_ms)
-                        await output_q.put(
-                            VideoFrameEvent(
-                                data=frame.data,
-                                timestamp_ms=frame.timestamp_ms,
-                                frame_index=frame.frame_index,
-                                width=frame.width,
-                                height=frame.height,
-                                content_type=frame.content_type,
-                                drift_ms=drift,
-                            )
+                        event = VideoFrameEvent(
+                            data=frame.data,
+                            timestamp_ms=frame.timestamp_ms,
+                            frame_index=frame.frame_index,
+                            width=frame.width,
+                            height=frame.height,
+                            content_type=frame.content_type,
+                            drift_ms=drift,
                         )
+                        # Fast path skips the put() coroutine; only wait when the queue is full
+                        try:
+                            output_q.put_nowait(event)
+                        except asyncio.QueueFull:
+                            await output_q.put(event)
                         frame_counter += 1
 
             avatar_task = asyncio.create_task(_avatar_worker())
 
         # Send user text and stream response (connection already established)
-        session.transition("LLM_RUN")
+        session.transition(SessionState.LLM_RUN)
         await self.realtime.send_user_text(text)
 
         try:
             async for event in self.realtime.stream_events():
-                await output_q.put(event)
-
                 if isinstance(event, TextDeltaEvent):
+                    if send_text:
+                        try:
+                            output_q.put_nowait(event)
+                        except asyncio.QueueFull:
+                            await output_q.put(event)
                     full_response.append(event.token)
 
                 elif isinstance(event, AudioChunkEvent):
-                    session.transition("TTS_RUN")
-                    session.transition("AVATAR_RUN")
+                    if send_audio:
+                        await output_q.put(event)
+                    if not audio_started:
+                        # State only changes on the first chunk of the turn
+                        session.transition(SessionState.TTS_RUN)
+                        session.transition(SessionState.AVATAR_RUN)
+                        audio_started = True
 
                     audio_chunk = AudioChunk(
                         data=event.data,
@@ -191,6 +214,9 @@ class Orchestrator:
                     )
                     await avatar_q.put((audio_chunk, event.timestamp_ms))
 
+                else:
+                    await output_q.put(event)
+
         except asyncio.CancelledError:
             if is_push:
                 feed_task.cancel()
@@ -223,5 +249,5 @@ class Orchestrator:
         if full_response:
             session.append_history("assistant", "".join(full_response))
 
-        session.transition("TURN_COMPLETE")
+        session.transition(SessionState.TURN_COMPLETE)
         # TurnCompleteEvent is yielded by stream_events(), so we don't send it again
@@ -2,28 +2,31 @@
 from __future__ import annotations
 import asyncio
 import uuid
+from collections import deque
+from enum import Enum
 from typing import Any
 from tth.alignment.drift import DriftController
 from tth.core.types import EmotionControl, CharacterControl, TurnControl
 from tth.control.personas import get_persona_defaults, get_persona_name
 
+# Messages kept in session.context["history"]; the oldest are dropped beyond this
+HISTORY_MAX_MESSAGES = 32
+
+
+class SessionState(str, Enum):
+    IDLE = "IDLE"
+    LLM_RUN = "LLM_RUN"
+    TTS_RUN = "TTS_RUN"
+    AVATAR_RUN = "AVATAR_RUN"
+    STREAMING_OUTPUT = "STREAMING_OUTPUT"
+    TURN_COMPLETE = "TURN_COMPLETE"
+    TURN_ERROR = "TURN_ERROR"
+    INTERRUPTED = "INTERRUPTED"
+
 
 class Session:
     """Per-session state machine."""
 
-    VALID_STATES = frozenset(
-        {
-            "IDLE",
-            "LLM_RUN",
-            "TTS_RUN",
-            "AVATAR_RUN",
-            "STREAMING_OUTPUT",
-            "TURN_COMPLETE",
-            "TURN_ERROR",
-            "INTERRUPTED",
-        }
-    )
-
     def __init__(
         self,
         session_id: str,
@@ -33,22 +36,23 @@ class Session:
         self.id = session_id
         self.persona_defaults = persona_defaults
         self.context: dict[str, Any] = {
-            "history": [],
+            "history": deque(maxlen=HISTORY_MAX_MESSAGES),
             "persona_name": persona_name,
         }
         self.pending_control: TurnControl | None = None
         self.current_turn_task: asyncio.Task[None] | None = None
         self.relay_task: asyncio.Task[None] | None = None
         self.last_audio_ts: list[float] = [0.0]  # shared between feed and relay
+        # Set by run_turn from the turn's types; the push relay drops frames while False
+        self.video_subscribed: bool = True
         self.drift_controller = DriftController()
-        self._state: str = "IDLE"
+        self._state = SessionState.IDLE
 
-    def transition(self, state: str) -> None:
-        assert state in self.VALID_STATES, f"Unknown state: {state}"
-        self._state = state
+    def transition(self, state: SessionState) -> None:
+        self._state = SessionState(state)
 
     @property
-    def state(self) -> str:
+    def state(self) -> SessionState:
         return self._state
 
     async def cancel_current_turn(self) -> None:
@@ -59,7 +63,7 @@ class Session:
             except asyncio.CancelledError:
                 pass
         self.current_turn_task = None
-        self._state = "IDLE"
+        self._state = SessionState.IDLE
 
     async def cancel_relay(self) -> None:
         """Cancel the persistent relay task (call on session/WebSocket close)."""
@@ -72,7 +76,10 @@ class Session:
         self.relay_task = None
 
     def append_history(self, role: str, content: str) -> None:
-        """Append a message to conversation history for multi-turn context."""
+        """Append a message to conversation history for multi-turn context.
+        Empty or whitespace-only content is not recorded."""
+        if not content or content.isspace():
+            return
         self.context["history"].append({"role": role, "content": content})
 
 
@@ -126,6 +126,118 @@ def test_stub_avatar_capabilities():
     assert caps.supports_identity is False
 
 
+# ── OpenAIRealtimeAdapter.stream_events ───────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_realtime_stream_merges_queued_text_deltas():
+    from tth.adapters.realtime.openai_realtime import OpenAIRealtimeAdapter
+    from tth.core.types import AudioChunkEvent, TextDeltaEvent, TurnCompleteEvent
+
+    adapter = OpenAIRealtimeAdapter()
+    audio = AudioChunkEvent(data=b"\x00" * 480, timestamp_ms=0, duration_ms=10)
+    for evt in (
+        TextDeltaEvent(token="Hel"),
+        TextDeltaEvent(token="lo"),
+        audio,
+        TextDeltaEvent(token=" there"),
+        TurnCompleteEvent(turn_id="t1"),
+    ):
+        adapter._push_event(evt)
+
+    events = [e async for e in adapter.stream_events()]
+    assert [e.type for e in events] == ["text_delta", "audio_chunk", "text_delta", "turn_complete"]
+    assert events[0].token == "Hello"
+    assert events[1] is audio
+    assert events[2].token == " there"
+
+
+@pytest.mark.asyncio
+async def test_realtime_stream_merges_queued_audio_deltas():
+    from tth.adapters.realtime.openai_realtime import OpenAIRealtimeAdapter
+    from tth.core.types import AudioChunkEvent, TurnCompleteEvent
+
+    adapter = OpenAIRealtimeAdapter()
+    adapter._push_event(AudioChunkEvent(data=b"\x01" * 480, timestamp_ms=5.0, duration_ms=10))
+    adapter._push_event(AudioChunkEvent(data=b"\x02" * 960, timestamp_ms=15.0, duration_ms=20))
+    adapter._push_event(TurnCompleteEvent(turn_id="t1"))
+
+    audio, done = [e async for e in adapter.stream_events()]
+    assert audio.data == b"\x01" * 480 + b"\x02" * 960
+    assert audio.timestamp_ms == 5.0
+    assert audio.duration_ms == pytest.approx(30.0)
+    assert done.type == "turn_complete"
+
+
+@pytest.mark.asyncio
+async def test_realtime_stream_waits_for_pushed_events():
+    import asyncio
+
+    from tth.adapters.realtime.openai_realtime import OpenAIRealtimeAdapter
+    from tth.core.types import TextDeltaEvent, TurnCompleteEvent
+
+    adapter = OpenAIRealtimeAdapter()
+
+    async def produce() -> None:
+        await asyncio.sleep(0.01)  # consumer is parked on an empty buffer by now
+        adapter._push_event(TextDeltaEvent(token="hi"))
+        adapter._push_event(TurnCompleteEvent(turn_id="t1"))
+
+    producer = asyncio.create_task(produce())
+    events = [e async for e in adapter.stream_events()]
+    await producer
+    assert [e.type for e in events] == ["text_delta", "turn_complete"]
+
+
+def test_realtime_server_events_dispatch_to_internal_events():
+    import base64
+
+    from tth.adapters.realtime.openai_realtime import OpenAIRealtimeAdapter
+
+    adapter = OpenAIRealtimeAdapter()
+    pcm = b"\x00\x01" * 2400  # 100ms at 24kHz
+    adapter._handle_server_event(
+        {"type": "response.output_audio.delta", "delta": base64.b64encode(pcm).decode()}
+    )
+    adapter._handle_server_event({"type": "response.audio_transcript.delta", "delta": "Hi"})
+    adapter._handle_server_event({"type": "rate_limits.updated"})
+    adapter._handle_server_event({"type": "response.done", "response": {"id": "r1"}})
+
+    audio, text, done = adapter._events
+    assert audio.data == pcm
+    assert audio.duration_ms == pytest.approx(100.0)
+    assert text.token == "Hi"
+    assert done.turn_id == "r1"
+
+
+def test_realtime_audio_timestamps_follow_media_timeline():
+    import base64
+
+    from tth.adapters.realtime.openai_realtime import OpenAIRealtimeAdapter
+
+    adapter = OpenAIRealtimeAdapter()
+    delta = base64.b64encode(b"\x00\x00" * 2400).decode()  # 100ms each
+    for _ in range(3):
+        adapter._handle_server_event({"type": "response.audio.delta", "delta": delta})
+    adapter._handle_server_event({"type": "response.done", "response": {"id": "r1"}})
+
+    first, second, third, _done = adapter._events
+    assert second.timestamp_ms == pytest.approx(first.timestamp_ms + 100.0)
+    assert third.timestamp_ms == pytest.approx(first.timestamp_ms + 200.0)
+    assert adapter._audio_wall_ms is None  # next response re-anchors
+
+
+def test_realtime_ignorable_probe_only_skips_unhandled_top_level_types():
+    from tth.adapters.realtime.openai_realtime import OpenAIRealtimeAdapter
+
+    adapter = OpenAIRealtimeAdapter()
+    assert adapter._is_ignorable(b'{"type":"rate_limits.updated","event_id":"e1"}')
+    assert not adapter._is_ignorable(b'{"type":"response.done","response":{"id":"r1"}}')
+    # type not first or spaced differently: fall back to a full parse
+    assert not adapter._is_ignorable(b'{"event_id":"e1","type":"rate_limits.updated"}')
+    assert not adapter._is_ignorable(b'{"type": "rate_limits.updated"}')
+
+
 # ── estimate_mp3_duration_ms ──────────────────────────────────────────────────
 
 
@@ -157,6 +269,17 @@ def test_drift_controller():
     assert dc.mean_drift_ms == pytest.approx(0.0)
 
 
+def test_drift_controller_mean_tracks_sliding_window():
+    from tth.alignment.drift import DriftController
+
+    dc = DriftController(window=3)
+    for drift in (100.0, 10.0, 20.0, 30.0):
+        dc.update(0.0, drift)
+    # 100 has been evicted; mean of [10, 20, 30]
+    assert dc.mean_drift_ms == pytest.approx(20.0)
+    assert dc.max_drift_ms == pytest.approx(30.0)
+
+
 def test_drift_controller_within_budget():
     from tth.alignment.drift import DriftController
 
@@ -187,7 +310,7 @@ def test_drift_controller_reset():
 
 @pytest.mark.asyncio
 async def test_session_state_transitions():
-    from tth.pipeline.session import Session
+    from tth.pipeline.session import Session, SessionState
     from tth.core.types import TurnControl
 
     s = Session("test-id", TurnControl())
@@ -199,6 +322,33 @@ async def test_session_state_transitions():
     s.transition("TTS_RUN")
     assert s.state == "TTS_RUN"
 
+    s.transition(SessionState.AVATAR_RUN)
+    assert s.state is SessionState.AVATAR_RUN
+
+    with pytest.raises(ValueError):
+        s.transition("NOT_A_STATE")
+
+
+def test_session_history_is_bounded():
+    from tth.pipeline.session import HISTORY_MAX_MESSAGES, Session
+
+    s = Session("test-id", TurnControl())
+    for i in range(HISTORY_MAX_MESSAGES + 5):
+        s.append_history("user", str(i))
+    history = s.context["history"]
+    assert len(history) == HISTORY_MAX_MESSAGES
+    assert history[0]["content"] == "5"
+
+
+def test_session_history_skips_blank_messages():
+    from tth.pipeline.session import Session
+
+    s = Session("test-id", TurnControl())
+    s.append_history("assistant", "")
+    s.append_history("assistant", " \n ")
+    s.append_history("user", "hi")
+    assert [m["content"] for m in s.context["history"]] == ["hi"]
+
 
 @pytest.mark.asyncio
 async def test_session_cancel_no_task():
@@ -116,6 +116,30 @@ class TestStubAvatar:
         for i in range(len(frames) - 1):
             assert frames[i].timestamp_ms <= frames[i + 1].timestamp_ms
 
+    @pytest.mark.asyncio
+    async def test_stub_skips_frames_without_video_subscriber(
+        self, sample_audio, turn_control, context
+    ):
+        """Stub should yield nothing when the client did not ask for video."""
+        adapter = StubAvatarAdapter({"fps": 25})
+        await adapter.load()
+
+        chunk = AudioChunk(
+            data=sample_audio,
+            timestamp_ms=0.0,
+            duration_ms=100.0,
+            encoding="pcm",
+            sample_rate=24000,
+        )
+
+        frames = [
+            frame
+            async for frame in adapter.infer_stream(
+                chunk, turn_control, {**context, "video_subscribed": False}
+            )
+        ]
+        assert frames == []
+
     @pytest.mark.asyncio
     async def test_stub_health(self):
         """Stub adapter health check."""
@@ -264,3 +288,128 @@ class TestAvatarFrameValidation:
                 assert frame.timestamp_ms == i * 50.0
 
         assert total_frames >= 3, "Should generate frames for each chunk"
+
+
+class _ScriptedRealtime:
+    """Stands in for the Realtime adapter: replays a fixed list of events."""
+
+    def __init__(self, events):
+        self._events = events
+
+    async def send_user_text(self, text):
+        pass
+
+    async def stream_events(self):
+        for event in self._events:
+            yield event
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_frame_indices_continue_across_chunks(turn_control):
+    """The per-turn avatar context carries frame_counter forward between chunks."""
+    import asyncio
+
+    from tth.core.types import AudioChunkEvent, TurnCompleteEvent, VideoFrameEvent
+    from tth.pipeline.orchestrator import Orchestrator
+    from tth.pipeline.session import Session
+
+    pcm = b"\x00" * 4800  # 100ms -> 2 frames at 25fps
+    realtime = _ScriptedRealtime(
+        [
+            AudioChunkEvent(data=pcm, timestamp_ms=0.0, duration_ms=100.0),
+            AudioChunkEvent(data=pcm, timestamp_ms=100.0, duration_ms=100.0),
+            TurnCompleteEvent(turn_id="t1"),
+        ]
+    )
+    orch = Orchestrator(realtime, StubAvatarAdapter({}))
+    session = Session("s1", turn_control)
+    output_q: asyncio.Queue = asyncio.Queue()
+
+    await orch.run_turn(session, "hi", turn_control, output_q, types=("video",))
+
+    frames = []
+    while not output_q.empty():
+        event = output_q.get_nowait()
+        if isinstance(event, VideoFrameEvent):
+            frames.append(event.frame_index)
+    assert frames == [0, 1, 2, 3]
+
+
+class _PushAvatar(StubAvatarAdapter):
+    """Push-model stand-in: relay_frames yields whatever the test puts on frames_q."""
+
+    def __init__(self):
+        super().__init__({})
+        self.frames_q = None
+
+    def capabilities(self):
+        caps = super().capabilities()
+        return caps.model_copy(update={"has_streaming_frames": True})
+
+    async def infer_stream(self, input, control, context):
+        return
+        yield
+
+    async def relay_frames(self, stop):
+        while True:
+            yield await self.frames_q.get()
+
+
+@pytest.mark.asyncio
+async def test_push_relay_honours_turn_video_subscription(turn_control):
+    """Frames from a push-model relay are only forwarded while the latest turn asked for video."""
+    import asyncio
+
+    from tth.core.types import TurnCompleteEvent, VideoFrame, VideoFrameEvent
+    from tth.pipeline.orchestrator import Orchestrator
+    from tth.pipeline.session import Session
+
+    avatar = _PushAvatar()
+    avatar.frames_q = asyncio.Queue()
+    orch = Orchestrator(_ScriptedRealtime([TurnCompleteEvent(turn_id="t")]), avatar)
+    session = Session("s1", turn_control)
+    output_q: asyncio.Queue = asyncio.Queue()
+    frame = VideoFrame(data=b"\xff\xd8\xff\xd9", timestamp_ms=0.0, frame_index=0, width=2, height=2)
+
+    async def relayed_frames() -> int:
+        await avatar.frames_q.put(frame)
+        for _ in range(5):
+            await asyncio.sleep(0)
+        count = 0
+        while not output_q.empty():
+            count += isinstance(output_q.get_nowait(), VideoFrameEvent)
+        return count
+
+    await orch.start_session(session, output_q)
+    try:
+        await orch.run_turn(session, "hi", turn_control, output_q, types=("text", "audio"))
+        assert await relayed_frames() == 0
+        await orch.run_turn(session, "hi", turn_control, output_q)
+        assert await relayed_frames() == 1
+    finally:
+        await session.cancel_relay()
+
+
+@pytest.mark.asyncio
+async def test_push_feed_records_wall_clock_audio_time(turn_control):
+    """Push-model drift reference is the feed time, not the (ahead-of-clock) media timestamp."""
+    import asyncio
+    import time
+
+    from tth.core.types import AudioChunkEvent, TurnCompleteEvent
+    from tth.pipeline.orchestrator import Orchestrator
+    from tth.pipeline.session import Session
+
+    ahead_ms = time.monotonic() * 1000 + 60_000
+    realtime = _ScriptedRealtime(
+        [
+            AudioChunkEvent(data=b"\x00" * 4800, timestamp_ms=ahead_ms, duration_ms=100.0),
+            TurnCompleteEvent(turn_id="t"),
+        ]
+    )
+    orch = Orchestrator(realtime, _PushAvatar())
+    session = Session("s1", turn_control)
+
+    before = time.monotonic() * 1000
+    await orch.run_turn(session, "hi", turn_control, asyncio.Queue())
+    assert before <= session.last_audio_ts[0] <= time.monotonic() * 1000
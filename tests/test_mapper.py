@@ -50,6 +50,14 @@ def test_llm_system_prompt_high_expressivity():
     assert "expressive" in prompt
 
 
+def test_llm_system_prompt_tone_threshold():
+    # 0.3 and 0.31 render the same at .1f but fall on different sides of the tone threshold
+    low = TurnControl(emotion=EmotionControl(intensity=0.3))
+    high = TurnControl(emotion=EmotionControl(intensity=0.31))
+    assert "tone" not in build_llm_system_prompt(low)
+    assert "tone" in build_llm_system_prompt(high)
+
+
 # ── resolve ───────────────────────────────────────────────────────────────────
 
 
@@ -61,6 +69,7 @@ def test_resolve_uses_persona_defaults_when_user_default():
     )
     result = resolve(user, persona)
     assert result.emotion.label == EmotionLabel.HAPPY
+    assert result is persona
 
 
 def test_resolve_user_wins_over_persona():
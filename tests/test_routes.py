@@ -0,0 +1,139 @@
+# tests/test_routes.py
+"""WebSocket route tests against a fake orchestrator (no OpenAI connection)."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from tth.adapters.avatar.stub import StubAvatarAdapter
+from tth.adapters.realtime.openai_realtime import OpenAIRealtimeAdapter
+from tth.api import routes
+from tth.core.types import AudioChunkEvent, TextDeltaEvent, TurnCompleteEvent, VideoFrameEvent
+from tth.pipeline.session import SessionManager
+
+PCM = b"\x01\x02" * 240
+JPEGS = [b"\xff\xd8frame-0\xff\xd9", b"\xff\xd8f1\xff\xd9", b"\xff\xd8third\xff\xd9"]
+
+
+class _FakeOrchestrator:
+    def __init__(self):
+        self.realtime = OpenAIRealtimeAdapter()
+        self.avatar = StubAvatarAdapter({})
+        self.controls = []
+
+    async def start_session(self, session, output_q):
+        pass
+
+    async def run_turn(self, session, text, control, output_q, types=()):
+        self.controls.append(control)
+        if "text" in types:
+            for word in text.split():
+                await output_q.put(TextDeltaEvent(token=word + " "))
+        await output_q.put(AudioChunkEvent(data=PCM, timestamp_ms=0, duration_ms=10))
+        if "video" in types:
+            for i, jpeg in enumerate(JPEGS):
+                await output_q.put(
+                    VideoFrameEvent(
+                        data=jpeg,
+                        timestamp_ms=i * 40.0,
+                        frame_index=i,
+                        width=2,
+                        height=2,
+                        content_type="jpeg",
+                        drift_ms=0.0,
+                    )
+                )
+        await output_q.put(TurnCompleteEvent(turn_id="t1"))
+
+
+@pytest.fixture
+def client_and_session():
+    sm = SessionManager()
+    routes.set_session_manager(sm)
+    routes.set_orchestrator(_FakeOrchestrator())
+    app = FastAPI()
+    app.include_router(routes.router)
+    session = sm.create(persona_id="default")
+    with TestClient(app) as client:
+        yield client, session.id
+
+
+def test_stream_sends_base64_json_by_default(client_and_session):
+    client, sid = client_and_session
+    with client.websocket_connect(f"/v1/sessions/{sid}/stream") as ws:
+        ws.send_json({"type": "user_text", "text": "hi", "types": ["text", "audio"]})
+        assert ws.receive_json()["type"] == "text_delta"
+        audio = ws.receive_json()
+        assert audio["type"] == "audio_chunk"
+        assert isinstance(audio["data"], str)
+        assert ws.receive_json()["type"] == "turn_complete"
+
+
+def test_stream_binary_subprotocol_sends_raw_media(client_and_session):
+    client, sid = client_and_session
+    with client.websocket_connect(
+        f"/v1/sessions/{sid}/stream", subprotocols=[routes.BINARY_SUBPROTOCOL]
+    ) as ws:
+        assert ws.accepted_subprotocol == routes.BINARY_SUBPROTOCOL
+        ws.send_json({"type": "user_text", "text": "hi", "types": ["text", "audio"]})
+        assert ws.receive_json()["type"] == "text_delta"
+        header = ws.receive_json()
+        assert header["type"] == "audio_chunk"
+        assert "data" not in header
+        assert ws.receive_bytes() == PCM
+        assert ws.receive_json()["type"] == "turn_complete"
+
+
+def test_stream_binary_subprotocol_batches_queued_frames(client_and_session):
+    client, sid = client_and_session
+    with client.websocket_connect(
+        f"/v1/sessions/{sid}/stream", subprotocols=[routes.BINARY_SUBPROTOCOL]
+    ) as ws:
+        ws.send_json({"type": "user_text", "text": "hi", "types": ["audio", "video"]})
+        assert ws.receive_json()["type"] == "audio_chunk"
+        assert ws.receive_bytes() == PCM
+        header = ws.receive_json()
+        assert header["type"] == "video_frame_batch"
+        assert [f["frame_index"] for f in header["frames"]] == [0, 1, 2]
+        assert header["sizes"] == [len(j) for j in JPEGS]
+        assert ws.receive_bytes() == b"".join(JPEGS)
+        assert ws.receive_json()["type"] == "turn_complete"
+
+
+def test_stream_coalesces_queued_text_deltas(client_and_session):
+    client, sid = client_and_session
+    with client.websocket_connect(f"/v1/sessions/{sid}/stream") as ws:
+        ws.send_json({"type": "user_text", "text": "hello there world", "types": ["text", "audio"]})
+        delta = ws.receive_json()
+        assert delta == {"type": "text_delta", "token": "hello there world "}
+        assert ws.receive_json()["type"] == "audio_chunk"
+        assert ws.receive_json()["type"] == "turn_complete"
+
+
+def test_models_endpoint_reports_capabilities(client_and_session):
+    client, _ = client_and_session
+    first = client.get("/v1/models")
+    assert first.status_code == 200
+    assert first.headers["content-type"] == "application/json"
+    assert first.json()["avatar"]["supports_streaming"] is True
+    assert client.get("/v1/models").content == first.content
+
+
+def test_health_endpoint_reports_components(client_and_session):
+    client, _ = client_and_session
+    body = client.get("/v1/health").json()
+    assert body["llm"] == body["tts"]
+    assert body["avatar"]["healthy"] is True
+
+
+def test_control_update_applies_to_next_turn_only(client_and_session):
+    client, sid = client_and_session
+    orch = routes.get_orchestrator()
+    with client.websocket_connect(f"/v1/sessions/{sid}/stream") as ws:
+        ws.send_json({"type": "control_update", "control": {"emotion": {"label": "happy"}}})
+        ws.send_json({"type": "interrupt"})
+        for _ in range(2):
+            ws.send_json({"type": "user_text", "text": "hi", "types": ["audio"]})
+            assert ws.receive_json()["type"] == "audio_chunk"
+            assert ws.receive_json()["type"] == "turn_complete"
+    assert [c.emotion.label.value for c in orch.controls] == ["happy", "neutral"]
@@ -40,6 +40,13 @@ def test_emotion_validation_intensity_bounds():
         EmotionControl(intensity=-0.1)
 
 
+def test_controls_are_immutable():
+    with pytest.raises(Exception):
+        EmotionControl().intensity = 0.9
+    with pytest.raises(Exception):
+        CharacterControl().speech_rate = 2.0
+
+
 def test_emotion_validation_valence_bounds():
     with pytest.raises(Exception):
         EmotionControl(valence=1.5)
@@ -229,6 +236,12 @@ def test_user_text_event():
     evt = UserTextEvent(type="user_text", text="Hello!")
     assert evt.text == "Hello!"
     assert evt.control == TurnControl()
+    assert evt.types == ["text", "audio", "video"]
+
+
+def test_user_text_event_types_rejects_unknown_stream():
+    with pytest.raises(Exception):
+        UserTextEvent(text="Hi", types=["text", "subtitles"])
 
 
 def test_user_text_event_with_control():